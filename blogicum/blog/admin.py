@@ -27,6 +27,7 @@ class PostAdmin(admin.ModelAdmin):
     list_editable = ('is_published',)
     date_hierarchy = 'pub_date'
     autocomplete_fields = ('author', 'category', 'location')
+    list_select_related = ('author', 'category')
 
 
 @admin.register(Comment)
@@ -34,3 +35,9 @@ class CommentAdmin(admin.ModelAdmin):
     list_display = ('text', 'author', 'post', 'created_at')
     list_filter = ('created_at', 'author')
     search_fields = ('text', 'author__username')
+    list_select_related = ('author', 'post')
+
+    def delete_queryset(self, request, queryset):
+        post_ids = list(queryset.values_list('post_id', flat=True))
+        super().delete_queryset(request, queryset)
+        Post.objects.filter(pk__in=post_ids).recount_comments()
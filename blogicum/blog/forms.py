@@ -19,9 +19,15 @@ class PostCreateForm(forms.ModelForm):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        for field_name in ('category', 'location'):
+        # Для выпадающих списков нужны только id и подпись (__str__).
+        for field_name, label_field in (
+            ('category', 'title'),
+            ('location', 'name'),
+        ):
             field = self.fields[field_name]
-            field.queryset = field.queryset.filter(is_published=True)
+            field.queryset = field.queryset.filter(
+                is_published=True
+            ).only(label_field).order_by(label_field)
 
 
 class CommentForm(forms.ModelForm):
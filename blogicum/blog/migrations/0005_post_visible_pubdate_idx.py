@@ -0,0 +1,17 @@
+# Generated by Django 3.2.16 on 2026-10-14 18:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0004_comment'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['-pub_date'], name='post_visible_pubdate_idx'),
+        ),
+    ]
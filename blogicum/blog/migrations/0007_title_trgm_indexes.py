@@ -0,0 +1,39 @@
+from django.db import migrations
+
+# Только CategoryAdmin ищет по одному title. В PostAdmin title объединён
+# через OR с text и author__username, и индекс на одном title не помогает.
+# Поиск в админке (icontains) на PostgreSQL компилируется в
+# UPPER("title"::text) LIKE UPPER(%s), поэтому индекс построен
+# по тому же выражению.
+TRGM_INDEXES = (
+    ('category_title_upper_trgm', 'blog_category'),
+)
+
+
+def create_trgm_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, table in TRGM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} '
+            f'ON {table} USING gin ((UPPER(title::text)) gin_trgm_ops)'
+        )
+
+
+def drop_trgm_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, _ in TRGM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0006_post_comment_count'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trgm_indexes, drop_trgm_indexes),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 3.2.16 on 2026-10-14 18:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0008_post_visible_pubdate_id_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['author', '-pub_date', '-id'], name='post_author_pubdate_idx'),
+        ),
+    ]
@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models import Count, F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce, Greatest, Now
 from core.models import BaseModel
 from django.contrib.auth import get_user_model
 
@@ -36,6 +38,27 @@ class Location(BaseModel):
         return self.name
 
 
+class PostQuerySet(models.QuerySet):
+    @staticmethod
+    def published_filter():
+        return Q(
+            is_published=True,
+            category__is_published=True,
+            pub_date__lte=Now()
+        )
+
+    def published(self):
+        return self.filter(self.published_filter())
+
+    def recount_comments(self):
+        comments = Comment.objects.filter(
+            post=OuterRef('pk')
+        ).order_by().values('post').annotate(
+            count=Count('pk')
+        ).values('count')
+        return self.update(comment_count=Coalesce(Subquery(comments), 0))
+
+
 class Post(BaseModel):
     title = models.CharField('Заголовок', max_length=256)
     text = models.TextField('Текст')
@@ -68,11 +91,29 @@ class Post(BaseModel):
         related_name='posts_by_category',
         verbose_name='Категория'
     )
+    comment_count = models.PositiveIntegerField(
+        'Количество комментариев',
+        default=0,
+        editable=False
+    )
+
+    objects = PostQuerySet.as_manager()
 
     class Meta:
         verbose_name = 'публикация'
         verbose_name_plural = 'Публикации'
         ordering = ('-pub_date',)
+        indexes = (
+            models.Index(
+                fields=('-pub_date', '-id'),
+                condition=Q(is_published=True),
+                name='post_visible_pubdate_idx'
+            ),
+            models.Index(
+                fields=('author', '-pub_date', '-id'),
+                name='post_author_pubdate_idx'
+            ),
+        )
 
     def __str__(self):
         return self.title
@@ -101,3 +142,13 @@ class Comment(models.Model):
 
     def __str__(self):
         return f'Комментарий от {self.author.username} к "{self.post.title}"'
+
+    def delete(self, *args, **kwargs):
+        # Счётчик уменьшается здесь, а не в post_delete: обработчик
+        # post_delete отключил бы быстрое каскадное удаление комментариев
+        # при удалении публикации или пользователя.
+        result = super().delete(*args, **kwargs)
+        Post.objects.filter(pk=self.post_id).update(
+            comment_count=Greatest(F('comment_count') - 1, 0)
+        )
+        return result
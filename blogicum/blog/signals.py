@@ -0,0 +1,58 @@
+from django.contrib.auth import get_user_model
+from django.db.models import F
+from django.db.models.signals import (
+    post_delete, post_save, pre_delete, pre_save
+)
+from django.dispatch import receiver
+
+from .models import Comment, Post
+
+User = get_user_model()
+
+
+@receiver(pre_save, sender=Comment)
+def remember_comment_post(sender, instance, raw, **kwargs):
+    # Комментарий могут перенести к другой публикации (например, в админке),
+    # тогда счётчик нужно пересчитать у обеих.
+    instance._old_post_id = None
+    if raw or not instance.pk:
+        return
+    instance._old_post_id = Comment.objects.filter(
+        pk=instance.pk
+    ).values_list('post_id', flat=True).first()
+
+
+@receiver(post_save, sender=Comment)
+def increase_comment_count(sender, instance, created, raw, **kwargs):
+    # Фикстуры (loaddata) уже содержат comment_count.
+    if raw:
+        return
+    if created:
+        Post.objects.filter(pk=instance.post_id).update(
+            comment_count=F('comment_count') + 1
+        )
+        return
+
+    old_post_id = instance._old_post_id
+    if old_post_id is not None and old_post_id != instance.post_id:
+        Post.objects.filter(
+            pk__in=(old_post_id, instance.post_id)
+        ).recount_comments()
+
+
+# Комментарии пользователя удаляются каскадом без Comment.delete(),
+# поэтому счётчик чужих публикаций пересчитывается после удаления.
+@receiver(pre_delete, sender=User)
+def remember_commented_posts(sender, instance, **kwargs):
+    instance._commented_post_ids = list(
+        Comment.objects.filter(author=instance).exclude(
+            post__author=instance
+        ).values_list('post_id', flat=True)
+    )
+
+
+@receiver(post_delete, sender=User)
+def recount_commented_posts(sender, instance, **kwargs):
+    Post.objects.filter(
+        pk__in=instance._commented_post_ids
+    ).recount_comments()
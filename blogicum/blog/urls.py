@@ -9,7 +9,7 @@ urlpatterns = [
     path('posts/<int:post_id>/', views.post_detail, name='post_detail'),
     path(
         'category/<slug:category_slug>/',
-        views.category_posts,
+        views.CategoryPostsView.as_view(),
         name='category_posts'
     ),
     path('profile/<str:username>/',
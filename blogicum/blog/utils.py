@@ -1,12 +1,108 @@
-from django.core.paginator import Paginator
-from django.db.models import Count
+from urllib.parse import urlencode
 
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
 
-def annotate_comment(queryset):
-    return queryset.annotate(comment_count=Count('comments'))
+
+class KeysetPage:
+    def __init__(self, object_list, has_next, has_previous):
+        self.object_list = object_list
+        self.has_next = has_next
+        self.has_previous = has_previous
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    @property
+    def has_other_pages(self):
+        return self.has_next or self.has_previous
+
+    @property
+    def next_query(self):
+        if not self.object_list:
+            return ''
+        return _cursor_query('before', self.object_list[-1])
+
+    @property
+    def previous_query(self):
+        if not self.object_list:
+            return ''
+        return _cursor_query('after', self.object_list[0])
+
+
+def _cursor_query(prefix, post):
+    return urlencode({
+        prefix: post.pub_date.isoformat(),
+        f'{prefix}_id': post.id,
+    })
+
+
+# Верхняя граница BigAutoField.
+MAX_POST_ID = 2 ** 63 - 1
+
+
+def _get_cursor(request, prefix):
+    post_id = request.GET.get(f'{prefix}_id', '')
+    if not (post_id.isascii() and post_id.isdigit()):
+        return None
+    try:
+        pub_date = parse_datetime(request.GET.get(prefix, ''))
+        post_id = int(post_id)
+    except ValueError:
+        return None
+    if pub_date is None or post_id > MAX_POST_ID:
+        return None
+    return pub_date, post_id
 
 
 def paginate_queryset(request, queryset, per_page=10):
-    paginator = Paginator(queryset, per_page)
-    page_number = request.GET.get('page')
-    return paginator.get_page(page_number)
+    # Вместо OFFSET страница начинается сразу за последней публикацией
+    # предыдущей, поэтому глубина страницы не влияет на стоимость запроса.
+    queryset = queryset.order_by('-pub_date', '-id')
+    before = _get_cursor(request, 'before')
+    after = _get_cursor(request, 'after')
+
+    if after and not before:
+        pub_date, post_id = after
+        posts = list(queryset.filter(
+            Q(pub_date__gt=pub_date) | Q(pub_date=pub_date, id__gt=post_id)
+        ).reverse()[:per_page + 1])
+        if posts:
+            return KeysetPage(
+                posts[:per_page][::-1],
+                has_next=True,
+                has_previous=len(posts) > per_page
+            )
+    elif before:
+        pub_date, post_id = before
+        posts = list(queryset.filter(
+            Q(pub_date__lt=pub_date) | Q(pub_date=pub_date, id__lt=post_id)
+        )[:per_page + 1])
+        if posts:
+            return KeysetPage(
+                posts[:per_page],
+                has_next=len(posts) > per_page,
+                has_previous=True
+            )
+
+    # Без курсора, а также если курсор устарел и за ним ничего нет,
+    # показывается первая страница.
+    posts = list(queryset[:per_page + 1])
+    return KeysetPage(
+        posts[:per_page],
+        has_next=len(posts) > per_page,
+        has_previous=False
+    )
+
+
+class KeysetPaginationMixin:
+    # Подключает paginate_queryset() к ListView вместо Paginator.
+    def paginate_queryset(self, queryset, page_size):
+        page = paginate_queryset(self.request, queryset, page_size)
+        return None, page, page.object_list, page.has_other_pages
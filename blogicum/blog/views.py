@@ -1,6 +1,5 @@
 from django.shortcuts import get_object_or_404, render, redirect
-from blog.models import Post, Category, Comment
-from django.utils import timezone
+from blog.models import Post, PostQuerySet, Category, Comment
 from django.http import Http404
 
 from django.views.generic import (
@@ -10,16 +9,23 @@ from django.views.generic import (
 from django.contrib.auth import get_user_model
 from django.contrib.auth.mixins import LoginRequiredMixin
 
-from django.core.paginator import Paginator
 from django.urls import reverse, reverse_lazy
 
 from .forms import PostCreateForm, CommentForm
-from django.db.models import Count
+from django.db.models import F, Q
 
-from .utils import annotate_comment, paginate_queryset
+from .utils import KeysetPaginationMixin, paginate_queryset
 
 User = get_user_model()
 
+# Поля, которые выводит карточка поста (includes/post_card.html).
+POST_CARD_FIELDS = (
+    'title', 'text', 'pub_date', 'image', 'is_published', 'comment_count',
+    'author__username',
+    'category__title', 'category__slug', 'category__is_published',
+    'location__name', 'location__is_published',
+)
+
 
 class ProfileDetailView(DetailView):
     model = User
@@ -40,24 +46,13 @@ class ProfileDetailView(DetailView):
         if is_owner:
             posts = Post.objects.filter(author=self.object)
         else:
-            posts = Post.objects.filter(
-                author=self.object,
-                is_published=True,
-                category__is_published=True,
-                pub_date__lte=timezone.now()
-            )
-
-        posts = annotate_comment(posts).select_related(
+            posts = Post.objects.published().filter(author=self.object)
+
+        posts = posts.select_related(
             'author',
             'location',
             'category'
-        ).order_by('-pub_date')
-
-        # Сортировка указана в модели Post.Meta.ordering.
-        # Однако при использовании обратной связи (related_name)
-        # вместе с .annotate() Django не применяет сортировку автоматически.
-        # Поэтому для гарантии корректного порядка используется
-        # .order_by('-pub_date'), что соответствует значению из модели.
+        ).only(*POST_CARD_FIELDS)
 
         context['page_obj'] = paginate_queryset(self.request, posts, 10)
         return context
@@ -78,53 +73,40 @@ class ProfileUpdateView(LoginRequiredMixin, UpdateView):
         )
 
 
-class IndexListView(ListView):
+class IndexListView(KeysetPaginationMixin, ListView):
     model = Post
     template_name = 'blog/index.html'
     paginate_by = 10
 
     def get_queryset(self):
-        posts = Post.objects.filter(
-            is_published=True,
-            category__is_published=True,
-            pub_date__lte=timezone.now()
-        ).select_related('category', 'author', 'location')
-        return annotate_comment(posts).order_by('-pub_date')
-
-
-# def sort_post_by_date():
-#     current_time = timezone.now()
-#     return Post.objects.filter(
-#         is_published=True,
-#         pub_date__lte=current_time,
-#         category__is_published=True
-#     ).select_related('author', 'location', 'category')
+        posts = Post.objects.published().select_related(
+            'category', 'author', 'location'
+        ).only(*POST_CARD_FIELDS)
+        return posts
 
 
 def post_detail(request, post_id):
     template = 'blog/detail.html'
+    is_visible = PostQuerySet.published_filter()
+    if request.user.is_authenticated:
+        is_visible |= Q(author=request.user)
 
-    try:
-        post = Post.objects.select_related(
+    post = get_object_or_404(
+        Post.objects.select_related(
             'author',
             'location',
             'category'
-        ).get(id=post_id)
-    except Post.DoesNotExist:
-        raise Http404(f"Пост с ID {post_id} не найден.")
-
-    is_author = request.user.is_authenticated and post.author == request.user
-    is_visible = (
-        post.is_published
-        and post.category.is_published
-        and post.pub_date <= timezone.now()
+        ).filter(is_visible),
+        pk=post_id
     )
 
-    if not (is_author or is_visible):
-        raise Http404(f"Пост с ID {post_id} недоступен.")
-
     comment_form = CommentForm()
-    comments = post.comments.all()
+    # Комментарии только выводятся, поэтому вместо моделей
+    # передаются словари с нужными полями.
+    comments = list(post.comments.values(
+        'id', 'text', 'created_at', 'author_id',
+        author_username=F('author__username')
+    ))
     context = {
         'post': post,
         'form': comment_form,
@@ -133,30 +115,25 @@ def post_detail(request, post_id):
     return render(request, template, context)
 
 
-def category_posts(request, category_slug):
-    template = 'blog/category.html'
-    category = get_object_or_404(
-        Category.objects.filter(is_published=True),
-        slug=category_slug
-    )
-
-    post_list = category.posts_by_category.filter(
-        is_published=True,
-        pub_date__lte=timezone.now()
-    )
-    post_list = annotate_comment(post_list).select_related(
-        'author',
-        'location',
-        'category'
-    ).order_by('-pub_date')
+class CategoryPostsView(KeysetPaginationMixin, ListView):
+    template_name = 'blog/category.html'
+    paginate_by = 10
 
-    page_obj = paginate_queryset(request, post_list, 10)
+    def get_queryset(self):
+        self.category = get_object_or_404(
+            Category.objects.filter(is_published=True),
+            slug=self.kwargs['category_slug']
+        )
+        return self.category.posts_by_category.published().select_related(
+            'author',
+            'location',
+            'category'
+        ).only(*POST_CARD_FIELDS)
 
-    context = {
-        'category': category,
-        'page_obj': page_obj
-    }
-    return render(request, template, context)
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['category'] = self.category
+        return context
 
 
 class PostCreateView(LoginRequiredMixin, CreateView):
@@ -182,10 +159,21 @@ class PostUpdateView(LoginRequiredMixin, UpdateView):
     pk_url_kwarg = 'post_id'
 
     def dispatch(self, request, *args, **kwargs):
-        post = self.get_object()
-
-        if post.author != request.user or not request.user.is_authenticated:
-            return redirect('blog:post_detail', post_id=post.id)
+        post_id = self.kwargs['post_id']
+
+        # Переопределённый dispatch выполняется раньше проверки
+        # LoginRequiredMixin, поэтому аноним отсекается здесь без
+        # обращения к базе.
+        if not request.user.is_authenticated:
+            return self.handle_no_permission()
+
+        author_id = Post.objects.filter(
+            pk=post_id
+        ).values_list('author_id', flat=True).first()
+        if author_id is None:
+            raise Http404
+        if author_id != request.user.id:
+            return redirect('blog:post_detail', post_id=post_id)
         return super().dispatch(request, *args, **kwargs)
 
     def get_success_url(self):
@@ -229,10 +217,18 @@ class CommentUpdateView(LoginRequiredMixin, UpdateView):
         return context
 
     def dispatch(self, request, *args, **kwargs):
-        comment = self.get_object()
-
-        if comment.author != request.user or not request.user.is_authenticated:
-            return redirect('blog:post_detail', post_id=comment.post.id)
+        comment_id = self.kwargs['comment_id']
+
+        if not request.user.is_authenticated:
+            return self.handle_no_permission()
+
+        author_id = Comment.objects.filter(
+            pk=comment_id
+        ).values_list('author_id', flat=True).first()
+        if author_id is None:
+            raise Http404
+        if author_id != request.user.id:
+            return redirect('blog:post_detail', post_id=self.kwargs['post_id'])
         return super().dispatch(request, *args, **kwargs)
 
     def get_success_url(self):
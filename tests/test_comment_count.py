@@ -0,0 +1,103 @@
+import pytest
+from django.contrib.admin.sites import site
+from django.core import serializers
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def two_posts(mixer, user, published_category):
+    return mixer.cycle(2).blend(
+        "blog.Post", author=user, category=published_category
+    )
+
+
+def comment_count(post):
+    post.refresh_from_db(fields=["comment_count"])
+    return post.comment_count
+
+
+def test_create_increases_count(mixer, user, two_posts):
+    post, _ = two_posts
+    mixer.cycle(3).blend("blog.Comment", post=post, author=user)
+    assert comment_count(post) == 3
+
+
+def test_delete_decreases_count(mixer, user, two_posts):
+    post, _ = two_posts
+    comments = mixer.cycle(2).blend("blog.Comment", post=post, author=user)
+    comments[0].delete()
+    assert comment_count(post) == 1
+
+
+def test_edit_keeps_count(mixer, user, two_posts):
+    post, _ = two_posts
+    comment = mixer.blend("blog.Comment", post=post, author=user)
+    comment.text = "новый текст"
+    comment.save()
+    assert comment_count(post) == 1
+
+
+def test_move_updates_both_posts(mixer, user, two_posts):
+    old_post, new_post = two_posts
+    comments = mixer.cycle(2).blend(
+        "blog.Comment", post=old_post, author=user
+    )
+    comments[0].post = new_post
+    comments[0].save()
+    assert comment_count(old_post) == 1
+    assert comment_count(new_post) == 1
+
+
+def test_delete_does_not_go_below_zero(mixer, user, two_posts):
+    post, _ = two_posts
+    comment = mixer.blend("blog.Comment", post=post, author=user)
+    type(post).objects.filter(pk=post.pk).update(comment_count=0)
+    comment.delete()
+    assert comment_count(post) == 0
+
+
+def test_post_delete_fast_deletes_comments(mixer, user, two_posts):
+    post, _ = two_posts
+    mixer.cycle(5).blend("blog.Comment", post=post, author=user)
+    with CaptureQueriesContext(connection) as ctx:
+        post.delete()
+    sql = [query["sql"] for query in ctx.captured_queries]
+    assert not [q for q in sql if q.startswith('SELECT "blog_comment"')]
+    assert not [q for q in sql if q.startswith('UPDATE "blog_post"')]
+
+
+def test_user_delete_recounts_other_posts(
+    mixer, user, another_user, two_posts
+):
+    post, _ = two_posts
+    mixer.blend("blog.Comment", post=post, author=user)
+    mixer.blend("blog.Comment", post=post, author=another_user)
+    another_user.delete()
+    assert comment_count(post) == 1
+
+
+def test_admin_bulk_delete_recounts(mixer, user, two_posts):
+    post, other_post = two_posts
+    comments = mixer.cycle(3).blend("blog.Comment", post=post, author=user)
+    mixer.blend("blog.Comment", post=other_post, author=user)
+    comment_model = type(comments[0])
+    site._registry[comment_model].delete_queryset(
+        None,
+        comment_model.objects.filter(pk__in=[c.pk for c in comments[:2]]),
+    )
+    assert comment_count(post) == 1
+    assert comment_count(other_post) == 1
+
+
+def test_raw_load_keeps_stored_count(mixer, user, two_posts):
+    post, _ = two_posts
+    comment = mixer.blend("blog.Comment", post=post, author=user)
+    data = serializers.serialize("json", [comment])
+    comment.delete()
+    type(post).objects.filter(pk=post.pk).update(comment_count=1)
+    for obj in serializers.deserialize("json", data):
+        obj.save()
+    assert comment_count(post) == 1
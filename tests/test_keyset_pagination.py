@@ -0,0 +1,117 @@
+from datetime import timedelta
+from http import HTTPStatus
+
+import pytest
+from django.utils import timezone
+
+from conftest import N_PER_PAGE
+
+pytestmark = [pytest.mark.django_db]
+
+N_POSTS = N_PER_PAGE * 2 + 5
+
+
+@pytest.fixture
+def posts_with_tied_pub_dates(mixer, user, published_category):
+    # По две публикации на одно и то же время, чтобы порядок
+    # на границах страниц определялся по id.
+    start = timezone.now() - timedelta(days=N_POSTS)
+    pub_dates = (start + timedelta(days=i // 2) for i in range(N_POSTS))
+    return mixer.cycle(N_POSTS).blend(
+        "blog.Post",
+        author=user,
+        is_published=True,
+        category=published_category,
+        pub_date=pub_dates,
+    )
+
+
+@pytest.fixture
+def expected_ids(posts_with_tied_pub_dates):
+    return [
+        post.id for post in sorted(
+            posts_with_tied_pub_dates,
+            key=lambda post: (post.pub_date, post.id),
+            reverse=True,
+        )
+    ]
+
+
+def get_page(client, url):
+    response = client.get(url)
+    assert response.status_code == HTTPStatus.OK, (
+        f"Убедитесь, что страница `{url}` загружается без ошибок."
+    )
+    return response.context["page_obj"]
+
+
+def page_ids(page):
+    return [post.id for post in page]
+
+
+def test_forward_walk(client, expected_ids):
+    page = get_page(client, "/")
+    assert not page.has_previous
+    seen = page_ids(page)
+    while page.has_next:
+        page = get_page(client, f"/?{page.next_query}")
+        assert page.has_previous
+        seen += page_ids(page)
+    assert seen == expected_ids
+
+
+def test_backward_walk(client, expected_ids):
+    page = get_page(client, "/")
+    pages = [page_ids(page)]
+    while page.has_next:
+        page = get_page(client, f"/?{page.next_query}")
+        pages.append(page_ids(page))
+
+    while page.has_previous:
+        page = get_page(client, f"/?{page.previous_query}")
+        pages.pop()
+        assert page_ids(page) == pages[-1]
+    assert page_ids(page) == expected_ids[:N_PER_PAGE]
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "before=garbage&before_id=1",
+        "before=2020-13-45T00:00:00&before_id=1",
+        "before=2020-01-01T00:00:00%2B00:00&before_id=abc",
+        "before=2020-01-01T00:00:00%2B00:00&before_id=%C2%B2",
+        "before=2020-01-01T00:00:00%2B00:00&before_id=" + "9" * 40,
+        "after=2020-01-01T00:00:00%2B00:00&after_id=" + "9" * 40,
+        "after=2020-01-01T00:00:00%2B00:00",
+        "after_id=1",
+    ],
+)
+def test_malformed_cursor_shows_first_page(client, expected_ids, query):
+    page = get_page(client, f"/?{query}")
+    assert page_ids(page) == expected_ids[:N_PER_PAGE]
+    assert not page.has_previous
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "before=2000-01-01T00:00:00%2B00:00&before_id=1",
+        "after=2999-01-01T00:00:00%2B00:00&after_id=1",
+    ],
+)
+def test_empty_cursor_page_shows_first_page(
+    client, published_category, expected_ids, query
+):
+    for url in ("/", f"/category/{published_category.slug}/"):
+        page = get_page(client, f"{url}?{query}")
+        assert page_ids(page) == expected_ids[:N_PER_PAGE]
+        assert not page.has_previous
+        assert page.has_next
+
+
+def test_empty_list_has_no_cursors(client, published_category):
+    page = get_page(client, f"/category/{published_category.slug}/")
+    assert len(page) == 0
+    assert not page.has_other_pages
+    assert page.next_query == page.previous_query == ""